@@ -1,18 +1,27 @@
 """Handles the game's graphics using tkinter."""
 
-from logic import BOARD_ROWS, BOARD_COLUMNS, Logic
+from itertools import product
+from logic import BOARD_ROWS, BOARD_COLUMNS, Logic, MoveStatus, PLAYERS
 from tkinter import font
-import numpy
 import tkinter
 
 
 class Graphics(tkinter.Tk):
-    """The game's graphics, including its window, label, and board."""
+    """The game's graphics, including its window, label, and board.
+
+    When a forced redraw is needed (e.g. after batch-reconfiguring the board), use `update_idletasks()`.
+    Never call the blocking `update()`: it reprocesses all pending events, which can re-enter event
+    handlers and cascade into redundant relayouts during rapid clicks.
+    """
 
     _BUTTON_FOREGROUND_COLOUR = "black"
     """The foreground colour for the buttons used for the board."""
     _BUTTON_HIGHLIGHT_BACKGROUND_COLOUR = "lightblue"
     """The highlight background colour for the buttons used for the board."""
+    _PIECE_TEXT = "⬤"
+    """The text shown in a button containing a piece, i.e. a large filled circle."""
+    _TIE_MESSAGE = "It's a tie!"
+    """The message shown in the label when the game ends in a tie."""
 
     def __init__(self, logic: Logic) -> None:
         """Initializes the game's graphics.
@@ -22,15 +31,58 @@ class Graphics(tkinter.Tk):
         """
         super().__init__()  # Inherit from tkinter
 
-        self._squares: dict[tkinter.Button] = {}
-        """The squares in the board, made up of tkinter buttons."""
+        self._buttons_flat: list[tkinter.Button] = [None] * (BOARD_ROWS * BOARD_COLUMNS)
+        """The board's buttons in row-major GUI order, so the button at (row, column) is found with a single
+        list index at `row * BOARD_COLUMNS + column` — no tuple hashing at all."""
         self._logic: Logic = logic
         """The game's logic."""
+        self._gui_row = tuple(range(BOARD_ROWS - 1, -1, -1))
+        """Maps a logic row (0 at the bottom) to its GUI row (0 at the top), precomputed so the click path
+        indexes a tuple instead of recomputing the inversion arithmetic."""
+        self._label_font = ("Arial", 20, "bold")
+        """The font for the label shown above the board. A plain font spec tuple is enough for the static
+        label and avoids registering a named font in the Tcl interpreter."""
+        self._button_font = font.Font(size=30)
+        """The font shared by every button in the board. It determines the size of the squares."""
+
+        # There are only a few possible label messages per player, so they are formatted once here
+        # and looked up by player ID on every event, instead of rebuilding f-strings on every click.
+        self._turn_messages: dict[int, tuple[str, str]] = {
+            player.id: (f"Player {player.id} ({player.colour})'s turn.", player.colour) for player in PLAYERS
+        }
+        """Maps each player's ID to their (message, colour) for the start of their turn."""
+        self._win_messages: dict[int, tuple[str, str]] = {
+            player.id: (f"Player {player.id} wins!", player.colour) for player in PLAYERS
+        }
+        """Maps each player's ID to their (message, colour) for when they win the game."""
+        self._win_config: dict = {"default": "active", "highlightthickness": 3, "highlightcolor": ""}
+        """The button options used to highlight a winning square. Preallocated so the highlight loop does not
+        rebuild the dict; only `highlightcolor` is updated with the winner's colour."""
+        self._dirty_buttons: set[tkinter.Button] = set()
+        """The buttons touched since the last reset, so reset_board only reconfigures buttons that changed."""
+        self._last_label: tuple[str, str] | None = None
+        """The (message, colour) currently shown in the label, so identical updates skip the Tcl round-trip."""
 
         self.title("Connect Four")  # The window's title
+        self._create_menu()
         self._create_label()
         self._create_board()
 
+    def _create_menu(self) -> None:
+        """Creates the menu bar, which lets the user start a new game or exit the game."""
+        menu_bar = tkinter.Menu(master=self)
+        self.config(menu=menu_bar)
+
+        file_menu = tkinter.Menu(master=menu_bar, tearoff=False)
+        file_menu.add_command(label="Play Again", command=self.reset_board)
+        file_menu.add_separator()
+        # self.destroy tears down the Tk widgets deterministically; sys.exit would leave them to
+        # interpreter-shutdown finalizers, which is slower and can race pending event handlers.
+        file_menu.add_command(label="Exit", command=self.destroy)
+        menu_bar.add_cascade(label="File", menu=file_menu)
+
+        self.protocol("WM_DELETE_WINDOW", self.destroy)  # The window's close button takes the same path
+
     def _create_label(self) -> None:
         """Creates the label shown above the board."""
         display_frame = tkinter.Frame(master=self)
@@ -39,30 +91,34 @@ class Graphics(tkinter.Tk):
         # The label
         self.display = tkinter.Label(
             master=display_frame,
-            text=f"Player {self._logic.current_player.id} ({self._logic.current_player.colour}), make the first move!",
-            font=font.Font(family="Arial", size=20, weight="bold"),
+            text=self._logic.start_message,
+            font=self._label_font,
         )
 
         self.display.pack()
 
     def _create_board(self) -> None:
         """Creates the board using a grid of buttons."""
-        board_frame = tkinter.Frame(master=self)
-        board_frame.pack()
-
-        # Creates an empty button for every square in the board
-        for row, column in numpy.ndindex(BOARD_ROWS, BOARD_COLUMNS):
+        self._board_frame = tkinter.Frame(master=self)
+        """The frame containing the board's buttons."""
+        board_frame = self._board_frame
+
+        # Creates an empty button for every square in the board. Each button's command already knows its
+        # column, so a click dispatches straight to _play_column with no widget-to-coordinate lookup,
+        # and fires only on an actual button press.
+        for row, column in product(range(BOARD_ROWS), range(BOARD_COLUMNS)):
             button = tkinter.Button(
                 master=board_frame,
                 text="",
-                font=font.Font(size=30),  # Determines the size of the squares
+                font=self._button_font,
                 fg=self._BUTTON_FOREGROUND_COLOUR,
                 highlightbackground=self._BUTTON_HIGHLIGHT_BACKGROUND_COLOUR,
                 width=4,
                 height=2,
+                command=lambda column=column: self._play_column(column),
             )
 
-            self._squares[button] = (row, column)  # The buttons are now the squares in the board
+            self._buttons_flat[row * BOARD_COLUMNS + column] = button  # The buttons are now the squares in the board
 
             # Creates the board using a grid of buttons
             button.grid(
@@ -72,6 +128,96 @@ class Graphics(tkinter.Tk):
                 pady=1,  # Padding between rows
             )
 
+        # The frame is packed only after all 42 buttons are gridded, so the geometry manager solves
+        # the layout once for the populated frame instead of re-solving it after every insertion.
+        board_frame.pack()
+
+    def _highlight_winning_squares(self) -> None:
+        """Highlights the squares which won the game, in the winner's colour.
+
+        Only the winning buttons are touched: the logic provides the coordinates already translated
+        to the GUI's orientation, and each one is a single `_buttons_flat` index.
+        """
+        win_config = self._win_config
+        win_config["highlightcolor"] = self._logic.current_player.colour
+        for row, column in self._logic.winning_coordinates_gui:
+            button = self._buttons_flat[row * BOARD_COLUMNS + column]
+            button.config(**win_config)
+            self._dirty_buttons.add(button)
+
+    def _display_piece(self, button: tkinter.Button) -> None:
+        """Displays the current player's piece in the given button.
+
+        Args:
+            button: The button to display the piece in.
+        """
+        button.config(text=self._PIECE_TEXT, fg=self._logic.current_player.colour)
+        self._dirty_buttons.add(button)
+
+    def _update_label(self, message: str, colour: str) -> None:
+        """Updates the label shown above the board.
+
+        If the label already shows the message in the given colour, nothing is done.
+
+        Args:
+            message: The message to show in the label.
+            colour: The colour of the message.
+        """
+        if (message, colour) == self._last_label:
+            return
+
+        self._last_label = (message, colour)
+        self.display.config(text=message, fg=colour)
+
+    def reset_board(self) -> None:
+        """Resets the board and the label so a new game can be played.
+
+        The board frame is unmapped while its 42 buttons are reconfigured and remapped afterwards,
+        so Tk coalesces the redraws into a single layout pass instead of one per button.
+        """
+        self._logic.reset_game()
+        self._update_label(self._logic.start_message, self._BUTTON_FOREGROUND_COLOUR)
+
+        board_frame = self._board_frame
+        board_frame.pack_forget()  # Unmap the board so each button reconfiguration does not trigger a redraw
+
+        # Only the buttons touched since the last reset need reconfiguring; the rest are already clean.
+        # Each one is reset with a single low-level Tcl call, skipping the Python-side option
+        # normalization that button.config() would repeat per button.
+        tk_call = self.tk.call
+        for button in self._dirty_buttons:
+            tk_call(button._w, "configure", "-default", "normal", "-highlightthickness", 0, "-text", "")
+
+        self._dirty_buttons.clear()
+
+        board_frame.pack()  # Remap the board, redrawing every button in one pass
+        self.update_idletasks()
+
+    def _play_column(self, clicked_column: int) -> None:
+        """Handles a click on one of the board's buttons by making a move in the clicked column, if the move is valid.
+
+        Args:
+            clicked_column: The column of the button that was clicked.
+        """
+        logic = self._logic  # Bound locally once; the click path reads it several times
+
+        # One call validates the move, places the piece, and reports where it landed and the game's state
+        status, placed_square = logic.handle_move(clicked_column)
+
+        if placed_square is None:  # Ignore the click if the move was invalid
+            return
+
+        self._display_piece(self._buttons_flat[self._gui_row[placed_square.row] * BOARD_COLUMNS + placed_square.column])
+
+        if status is MoveStatus.WIN:
+            self._highlight_winning_squares()
+            self._update_label(*self._win_messages[logic.current_player.id])
+        elif status is MoveStatus.TIE:
+            self._update_label(self._TIE_MESSAGE, self._BUTTON_FOREGROUND_COLOUR)
+        else:  # Otherwise, it is the next player's turn
+            logic.switch_to_next_player()
+            self._update_label(*self._turn_messages[logic.current_player.id])
+
 
 def main() -> None:
     """Launches the game."""
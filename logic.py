@@ -1,6 +1,7 @@
 """Handles the game's logic."""
 
-from itertools import cycle
+from enum import Enum
+from sys import intern
 
 BOARD_ROWS = 6
 """The number of rows in the board."""
@@ -10,16 +11,31 @@ COMBINATION_LENGTH = 4
 """The number of a player's pieces in a row required to win the game, e.g. 4 for four-in-a-row."""
 
 
+class MoveStatus(Enum):
+    """The state of the game reported by `Logic.handle_move`, so callers can dispatch on the move's outcome
+    without re-querying the board afterwards."""
+
+    ONGOING = "ongoing"
+    """The move was made and the game continues."""
+    WIN = "win"
+    """The move won the game for the player who made it."""
+    TIE = "tie"
+    """The move filled the board without a winner."""
+    INVALID = "invalid"
+    """The move was rejected because the column is full or the game is already over. Nothing was placed."""
+
+
 class Player:
     """Represents a player and their ID and colour.
 
     Attributes:
         id: (int) The player's ID, from 1 to 9.
         colour: (str) The colour of the player's pieces.
-        winning_combination: (str) The player's ID repeated `COMBINATION_LENGTH` times.
-          Used to determine if the player has four in a row.
     """
 
+    __slots__ = ("id", "colour")
+    """The players live for the whole game, but slot storage keeps attribute access a fixed-offset load."""
+
     def __init__(self, id: int, colour: str) -> None:
         """Initializes the player and their attributes.
 
@@ -32,10 +48,8 @@ class Player:
 
         self.id: int = id
         """The player's ID. It can be from 1 to 9."""
-        self.colour: str = colour
-        """The colour of the player's pieces."""
-        self.winning_combination: str = str(id) * COMBINATION_LENGTH
-        """The player's ID repeated COMBINATION_LENGTH times, e.g. "1111"."""
+        self.colour: str = intern(colour)
+        """The colour of the player's pieces. Interned so colour comparisons hit the pointer-equality fast path."""
 
 
 class Square:
@@ -48,6 +62,10 @@ class Square:
         player_id: (int) The id of the player who placed a piece in the square.
     """
 
+    __slots__ = ("row", "column", "player_id")
+    """Squares are allocated for every column probe, so slot storage keeps them small and makes
+    attribute access a fixed-offset load instead of a dict lookup."""
+
     NO_ID: int = 0
     """Used in `player_id` to indicate that the square has no piece in it."""
 
@@ -81,7 +99,8 @@ class Square:
         if not isinstance(other, Square):  # `other` must be a `Square` to be equivalent
             return False
 
-        return (self.row, self.column, self.player_id) == (other.row, other.column, other.player_id)
+        # The fields are compared directly, avoiding the allocation of two tuples per comparison
+        return self.row == other.row and self.column == other.column and self.player_id == other.player_id
 
 
 PLAYERS = (
@@ -90,33 +109,120 @@ PLAYERS = (
 )
 """The players in the game."""
 
+_ALL_COLUMNS_FULL = (1 << BOARD_COLUMNS) - 1
+"""The `Logic.full_columns` value with every column's bit set, i.e. no column accepts a move."""
+
+_COLUMN_STRIDE = BOARD_ROWS + 1
+"""The number of bits each column occupies in a bitboard: one bit per row plus an always-empty sentinel bit,
+which stops runs in one column from bleeding into the next during shift-based tests."""
+_COLUMN_BITS = (1 << BOARD_ROWS) - 1
+"""A bitmask covering the playable bits of a single column in a bitboard."""
+
+_VERTICAL_SHIFT = 1
+"""The bitboard shift between a square and the square above it, i.e. one step along a column."""
+_HORIZONTAL_SHIFT = _COLUMN_STRIDE
+"""The bitboard shift between a square and the square to its right, i.e. one step along a row."""
+_ASCENDING_DIAGONAL_SHIFT = _COLUMN_STRIDE + 1
+"""The bitboard shift between a square and the square diagonally up-right of it."""
+_DESCENDING_DIAGONAL_SHIFT = _COLUMN_STRIDE - 1
+"""The bitboard shift between a square and the square diagonally down-right of it."""
+
+_WIN_SHIFTS = (_HORIZONTAL_SHIFT, _VERTICAL_SHIFT, _ASCENDING_DIAGONAL_SHIFT, _DESCENDING_DIAGONAL_SHIFT)
+"""The four direction shifts checked for a win after each move, so `handle_move` loads a single
+global per move instead of one per direction."""
+
 
 class Logic:
     """The game's logic.
 
     Attributes:
+        full_columns: (int) A bitmask with bit `column` set when that column accepts no more moves.
         winning_coordinates: (list[tuple[int, int]]) Contains the coordinates of the squares which won the game.
+        winning_coordinates_gui: (list[tuple[int, int]]) The winning coordinates, with rows inverted for the GUI.
         current_player: (Player) The player whose turn it is. If the game is won, then this is also the winner.
     """
 
     def __init__(self) -> None:
         """Initializes the game's logic."""
-        self._players = cycle(PLAYERS)
-        """The players in the game, in a cycle."""
-        self._current_squares: list[list[Square]] = []
-        """A list with all of the squares in the board, in the form [row][column]."""
+        self._current_player_index: int = 0
+        """The index of the current player in `PLAYERS`. With two players, switching turns is a single XOR."""
+        self._occupied_bitboard: int = 0
+        """A bitboard with a bit set for every occupied square, at bit index `column * _COLUMN_STRIDE + row`."""
+        self._piece_bitboards: dict[int, int] = {}
+        """One bitboard per player ID, with a bit set for every square holding that player's piece.
+        Together with `_occupied_bitboard`, this replaces a nested list of 42 `Square` objects, so moves and
+        win checks are a handful of integer operations instead of Python-level scans."""
+        self._column_heights: list[int] = []
+        """The number of pieces in each column, so the first empty row in a column is a single list index."""
+        self._move_count: int = 0
+        """The number of moves made in the current game. No four-in-a-row can exist before the current
+        player's fourth piece, so early moves skip the win checks entirely."""
         self._has_winner: bool = False
         """Used to determine if the game has a winner."""
+        self.full_columns: int = 0
+        """A bitmask with bit `column` set when that column accepts no more moves. All bits are set once the
+        game is won, so callers can reject any move with a single shift-and-mask test."""
         self.winning_coordinates: list[tuple[int, int]] = []
         """The coordinates of the squares which won the game, e.g. [(0, 2), (0, 3), ...]"""
-        self.current_player: Player = next(self._players)
+        self.winning_coordinates_gui: list[tuple[int, int]] = []
+        """The winning coordinates with their rows inverted for the GUI, whose row 0 is at the top of the board.
+        Computed once when the win is detected, so the GUI does not re-translate them on its click path."""
+        self.current_player: Player = PLAYERS[0]
         """The player whose turn it is."""
+        self._start_message: str | None = None
+        """The cached `start_message`, or `None` if it must be reformatted for the current player."""
 
         self._initialize_board()
 
+    @property
+    def start_message(self) -> str:
+        """The message inviting the current player to make the first move of a game.
+
+        Formatted at most once per turn change; repeated reads return the cached string.
+        """
+        if self._start_message is None:
+            self._start_message = f"Player {self.current_player.id} ({self.current_player.colour}), make the first move!"
+
+        return self._start_message
+
     def _initialize_board(self) -> None:
-        """Initialize all of the squares in the board, in the form [row][column]."""
-        self._current_squares = [[Square(row, column) for column in range(BOARD_COLUMNS)] for row in range(BOARD_ROWS)]
+        """Initializes the board's bitboards to an empty board."""
+        self._occupied_bitboard = 0
+        self._piece_bitboards = {player.id: 0 for player in PLAYERS}
+        self._column_heights = [0] * BOARD_COLUMNS
+        self._move_count = 0
+
+    def _set_position(self, board_2d: list[list[int]], current_player_id: int) -> None:
+        """Sets the board to the given position directly, bypassing `handle_move`. Test-only.
+
+        Lets tests build a mid-game state in one call instead of replaying a whole move sequence
+        through the production move path, so setup cost does not grow with the position's depth.
+
+        Args:
+            board_2d: The position to set, as `board_2d[row][column]` player IDs with row 0 at the
+              bottom of the board and `Square.NO_ID` marking empty squares. Pieces must stack from
+              the bottom, and the position must not already contain a four-in-a-row.
+            current_player_id: The ID of the player whose turn it is in the position.
+        """
+        self.reset_game()
+
+        for row, board_row in enumerate(board_2d):
+            for column, player_id in enumerate(board_row):
+                if player_id == Square.NO_ID:
+                    continue
+
+                move_bit: int = 1 << (column * _COLUMN_STRIDE + row)
+                self._occupied_bitboard |= move_bit
+                self._piece_bitboards[player_id] |= move_bit
+                self._column_heights[column] = row + 1
+                self._move_count += 1
+
+                if row == BOARD_ROWS - 1:  # The piece fills the column's top square
+                    self.full_columns |= 1 << column
+
+        self._current_player_index = current_player_id - 1  # `PLAYERS` is ordered by ID
+        self.current_player = PLAYERS[self._current_player_index]
+        self._start_message = None
 
     def get_first_empty_square_in_column(self, column: int) -> Square | None:
         """Gets the first empty square in the given column, if there is one.
@@ -130,12 +236,25 @@ class Logic:
         Returns:
             The first empty square in the column, or `None` if the column has no empty squares.
         """
-        column_squares: list[Square] = [row[column] for row in self._current_squares]
-        """A list of all the squares in the given column."""
+        column_height: int = self._column_heights[column]
+        """The number of pieces in the column. Pieces stack from the bottom, so this is also the first empty row."""
+
+        return Square(column_height, column) if column_height < BOARD_ROWS else None
 
-        # Iterate through `column_squares` and return the first empty square.
-        # If there are no empty squares, return `None`.
-        return next((square for square in column_squares if square.player_id == square.NO_ID), None)
+    def column_full(self, column: int) -> bool:
+        """Checks if the given column has no empty squares.
+
+        Unlike `is_valid_move`, this reports only whether the column is physically full,
+        regardless of whether the game is over. The answer is a single list index against
+        the cached column heights, with no `Square` allocation.
+
+        Args:
+            column: The index of the column to check.
+
+        Returns:
+            `True` if the column is full, `False` otherwise.
+        """
+        return self._column_heights[column] == BOARD_ROWS
 
     def is_valid_move(self, selected_column: int) -> bool:
         """Checks if a move is valid.
@@ -147,41 +266,52 @@ class Logic:
         Returns:
             `True` if the move is valid, `False` otherwise.
         """
-        # Checks if there is an empty square in the selected column
-        column_has_empty_square: bool = self.get_first_empty_square_in_column(selected_column) is not None
-        game_is_not_over: bool = not self._has_winner  # The game is not over if there is no winner
+        # A single bit test covers both conditions: a column's bit is set when it fills up,
+        # and every bit is set once the game is won.
+        return not (self.full_columns >> selected_column) & 1
 
-        return column_has_empty_square and game_is_not_over
+    def _check_for_win(self, shift: int) -> list[tuple[int, int]] | None:
+        """Checks if the current player has four-in-a-row along one direction,
+        and if they do, return the coordinates of the winning squares.
 
-    def _check_for_win_in_row(self, row: int) -> list[tuple[int, int]] | None:
-        """Checks if there is four-in-a-row in the given row, and if there is, return the coordinates of the winning squares.
+        The check is three shift-AND operations on the player's bitboard: a bit survives them only if the
+        three squares after it along the direction also hold the player's pieces, i.e. it starts a four-in-a-row.
 
         Args:
-            row: The index of the row to check.
+            shift: The bitboard shift between consecutive squares in the direction to check,
+              e.g. `_HORIZONTAL_SHIFT` for rows or `_VERTICAL_SHIFT` for columns.
 
         Returns:
             If there is a win, returns a list of the winning coordinates, e.g. [(0, 2), (0, 3), (0, 4), (0, 5)].
             Only four coordinates are returned in case of a five-in-a-row or greater.
             If there is no win, returns `None`.
         """
-        row_squares: list[Square] = self._current_squares[row]
-        """A list of all the squares in the given row."""
-        row_as_string: str = "".join(str(square.player_id) for square in row_squares)
-        """The row represented as a string, where each character represents the piece in the square, e.g. "0211112"."""
+        bitboard: int = self._piece_bitboards[self.current_player.id]
+        """The bitboard holding the current player's pieces."""
+        run_starts: int = bitboard & (bitboard >> shift)
+        """Bits which start a run of the current player's pieces along the direction. After the second
+        shift-AND below, only the starts of four-in-a-rows survive."""
+        run_starts &= run_starts >> (2 * shift)
+
+        if not run_starts:  # No four-in-a-row found
+            return None
 
-        # Looks for the four-in-a-row in `row_as_string` and gets the column it starts on, or -1 if there is no four-in-a-row
-        combination_start_column: int = row_as_string.find(self.current_player.winning_combination)
+        # Four-in-a-row found: decode each of its four bits into (row, column) coordinates
+        start_bit: int = (run_starts & -run_starts).bit_length() - 1
+        winning_coordinates: list[tuple[int, int]] = []
 
-        if combination_start_column >= 0:  # Four-in-a-row found: return the coordinates of the winning squares
-            return [(row, combination_start_column + i) for i in range(COMBINATION_LENGTH)]
-        else:  # No four-in-a-row found
-            return None
+        for i in range(COMBINATION_LENGTH):
+            column, row = divmod(start_bit + i * shift, _COLUMN_STRIDE)
+            winning_coordinates.append((row, column))
+
+        return winning_coordinates
 
-    def handle_move(self, selected_column: int) -> None:
+    def handle_move(self, selected_column: int) -> tuple[MoveStatus, Square | None]:
         """Places the current player's piece in the first empty square in the selected column,
         and checks if there is a win, i.e. a four-in-a-row.
 
-        The move should be valid, and should be checked beforehand.
+        The move is validated here: an invalid move changes nothing and is reported as such,
+        so callers do not need a separate validity check (or column scan) beforehand.
 
         If there is a win, the winner and the winning coordinates are saved.
         Only four coordinates of the first four-in-a-row found are saved, so not all of a five-in-a-row or greater is counted,
@@ -189,34 +319,92 @@ class Logic:
 
         Args:
             selected_column: The column selected for the move.
+
+        Returns:
+            A tuple of the state of the game after the move, and the square the piece was placed in
+            (or `None` if the move was invalid), so the caller does not need to re-query the board.
         """
+        if (self.full_columns >> selected_column) & 1:  # The column is full, or the game is already over
+            return MoveStatus.INVALID, None
+
         first_empty_square: Square = self.get_first_empty_square_in_column(selected_column)
         """The first empty square in the column. Only its coordinates (`row` and `column`) should be used."""
 
         # Places the current player's piece where the first empty square is
-        self._current_squares[first_empty_square.row][first_empty_square.column].player_id = self.current_player.id
+        move_bit: int = 1 << (selected_column * _COLUMN_STRIDE + first_empty_square.row)
+        self._occupied_bitboard |= move_bit
+        self._piece_bitboards[self.current_player.id] |= move_bit
+        self._column_heights[selected_column] = first_empty_square.row + 1
+        self._move_count += 1
+
+        if first_empty_square.row == BOARD_ROWS - 1:  # The piece filled the column's top square
+            self.full_columns |= 1 << first_empty_square.column
 
         # Checks for a win in the row, column, and both diagonals where the piece was placed.
         # Only the coordinates for the first win found are saved.
-        # TODO: Write tests for this.
-        winning_coordinates: list[tuple[int, int]] | None = self._check_for_win_in_row(first_empty_square.row)
+        # A win needs COMBINATION_LENGTH pieces from one player, which cannot exist before the
+        # (2 * COMBINATION_LENGTH - 1)th move of the game, so earlier moves skip the checks.
+        winning_coordinates: list[tuple[int, int]] | None = None
 
-        if winning_coordinates is None:
-            # TODO: Check column win and assign to winning_coordinates
-            pass
+        if self._move_count >= 2 * COMBINATION_LENGTH - 1:
+            check_for_win = self._check_for_win  # Bound locally once for the loop
 
-        if winning_coordinates is None:
-            # TODO: Check ascending diagonal win and assign to winning_coordinates
-            pass
+            for shift in _WIN_SHIFTS:
+                winning_coordinates = check_for_win(shift)
 
-        if winning_coordinates is None:
-            # TODO: Check descending diagonal win and assign to winning_coordinates
-            pass
+                if winning_coordinates is not None:
+                    break
 
         if winning_coordinates is not None:  # If four-in-a-row was found
             self._has_winner = True
+            self.full_columns = _ALL_COLUMNS_FULL  # A won game accepts no more moves in any column
             self.winning_coordinates = winning_coordinates
+            self.winning_coordinates_gui = [(BOARD_ROWS - row - 1, column) for row, column in winning_coordinates]
+            return MoveStatus.WIN, first_empty_square
+
+        if self.full_columns == _ALL_COLUMNS_FULL:  # The board is full without a four-in-a-row
+            return MoveStatus.TIE, first_empty_square
+
+        return MoveStatus.ONGOING, first_empty_square
+
+    def handle_move_batch(self, columns: list[int]) -> MoveStatus:
+        """Plays a sequence of moves in one call, alternating players after each non-terminal move.
+
+        Intended for bulk playouts (e.g. scripted games or future AI rollouts), where per-move call
+        overhead adds up: the bound methods are hoisted out of the loop and the sequence stops at the
+        first move that ends (or fails to change) the game.
+
+        Args:
+            columns: The columns to place pieces in, in order.
+
+        Returns:
+            The status of the last move made: `ONGOING` if the whole sequence was played,
+            or the `WIN`/`TIE`/`INVALID` status that stopped it.
+        """
+        status: MoveStatus = MoveStatus.ONGOING
+        handle_move = self.handle_move
+        switch_to_next_player = self.switch_to_next_player
+
+        for column in columns:
+            status, _ = handle_move(column)
+
+            if status is not MoveStatus.ONGOING:  # The game ended, or the move was invalid
+                break
+
+            switch_to_next_player()
+
+        return status
 
     def switch_to_next_player(self) -> None:
         """Switches the current player to the next player."""
-        self.current_player = next(self._players)
+        self._current_player_index ^= 1
+        self.current_player = PLAYERS[self._current_player_index]
+        self._start_message = None  # The cached start message names the previous player
+
+    def reset_game(self) -> None:
+        """Resets the game so a new game can be played. The current player keeps their turn."""
+        self._initialize_board()
+        self._has_winner = False
+        self.full_columns = 0
+        self.winning_coordinates = []
+        self.winning_coordinates_gui = []
@@ -3,7 +3,7 @@ Contains tests for the application using pytest.
 The tests are ran from the command line with the command: pytest
 """
 
-from logic import BOARD_ROWS, Logic, Square
+from logic import BOARD_ROWS, Logic, MoveStatus, Square
 import pytest
 
 
@@ -31,3 +31,66 @@ def test_get_first_empty_square_in_column(logic: Logic) -> None:
 
     # Checks that the column is full, since there should be no empty squares in it.
     assert logic.get_first_empty_square_in_column(column) is None, "A full column should have no empty squares."
+
+
+def test_column_full(logic: Logic) -> None:
+    """Tests `Logic.column_full()` with an empty, a partially filled, and a full column.
+
+    The full column is planted directly with `Logic._set_position()` instead of six `handle_move()` calls.
+    """
+    assert not logic.column_full(0), "An empty column should not be full."
+
+    logic._set_position([[1, 2, 0, 0, 0, 0, 0],
+                         [2, 1, 0, 0, 0, 0, 0],
+                         [1, 0, 0, 0, 0, 0, 0],
+                         [2, 0, 0, 0, 0, 0, 0],
+                         [1, 0, 0, 0, 0, 0, 0],
+                         [2, 0, 0, 0, 0, 0, 0]], current_player_id=1)
+
+    assert logic.column_full(0), "A column with six pieces should be full."
+    assert not logic.column_full(1), "A partially filled column should not be full."
+
+
+def test_handle_move_batch(logic: Logic) -> None:
+    """Tests that `Logic.handle_move_batch()` plays a whole sequence, stops on the move that ends the game,
+    and reports that move's status."""
+    assert logic.handle_move_batch([0, 1, 0, 1, 0]) is MoveStatus.ONGOING, "An unfinished sequence should be ONGOING."
+    assert logic.handle_move_batch([1, 2, 1]) is MoveStatus.WIN, "Player 2 should win with a four-in-a-row in column 1."
+    assert logic.winning_coordinates == [(0, 1), (1, 1), (2, 1), (3, 1)]
+
+
+WIN_CASES = [
+    pytest.param([[1, 1, 1, 0, 0, 0, 0],
+                  [2, 2, 2, 0, 0, 0, 0]],
+                 3, [(0, 0), (0, 1), (0, 2), (0, 3)], id="row"),
+    pytest.param([[0, 0, 1, 2, 0, 0, 0],
+                  [0, 0, 1, 2, 0, 0, 0],
+                  [0, 0, 1, 2, 0, 0, 0]],
+                 2, [(0, 2), (1, 2), (2, 2), (3, 2)], id="column"),
+    pytest.param([[1, 2, 2, 2, 0, 0, 0],
+                  [0, 1, 1, 2, 0, 0, 0],
+                  [0, 0, 1, 2, 0, 0, 0]],
+                 3, [(0, 0), (1, 1), (2, 2), (3, 3)], id="ascending_diagonal"),
+    pytest.param([[2, 2, 2, 1, 0, 0, 0],
+                  [2, 2, 1, 0, 0, 0, 0],
+                  [2, 1, 0, 0, 0, 0, 0]],
+                 0, [(3, 0), (2, 1), (1, 2), (0, 3)], id="descending_diagonal"),
+]
+"""One win-detection case per direction: the position one move before player 1's win (as a
+`Logic._set_position()` grid, row 0 at the bottom), the column that completes the four-in-a-row,
+and the winning coordinates expected afterwards."""
+
+
+@pytest.mark.parametrize("board_2d, winning_column, expected_coordinates", WIN_CASES)
+def test_check_for_win(logic: Logic, board_2d: list[list[int]], winning_column: int,
+                       expected_coordinates: list[tuple[int, int]]) -> None:
+    """Tests that `Logic.handle_move()` detects a four-in-a-row along each direction and saves its coordinates.
+
+    The position one move before the win is planted directly with `Logic._set_position()`,
+    so only the winning move itself runs through the production move path.
+    """
+    logic._set_position(board_2d, current_player_id=1)
+
+    status, _ = logic.handle_move(winning_column)
+    assert status is MoveStatus.WIN, f"Player 1 should win with the four-in-a-row {expected_coordinates}."
+    assert logic.winning_coordinates == expected_coordinates